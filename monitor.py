@@ -2,6 +2,7 @@ import sys
 
 # --- Dependency Check ---
 try:
+    import orjson
     import requests
     from selenium import webdriver
     from dotenv import load_dotenv
@@ -13,16 +14,18 @@ except ImportError as e:
     print("\n    pip install -r requirements.txt\n", file=sys.stderr)
     sys.exit(1)
 
-import json
+import atexit
 import os
-import time
 import logging
 import signal
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
-from tqdm import tqdm
 import wandb
 from rmv_checker import (
+    MonitoredLocation,
+    create_driver,
     get_rmv_data, 
     get_all_locations,
     prompt_for_rmv_url,
@@ -31,7 +34,6 @@ from rmv_checker import (
     prompt_for_frequency,
     prompt_for_notify_month_year
 )
-from selenium.webdriver.chrome.service import Service as ChromeService
 
 # --- Logging Setup ---
 logger = logging.getLogger(__name__)
@@ -58,23 +60,87 @@ if not logger.handlers:
 STATE_FILE = 'state.json'
 LOCATIONS_MAP_FILE = 'locations_map.json'
 APPOINTMENT_TEXT_FILE = 'booking.md'
+# Formats of the scraped appointment strings, with and without a time slot.
+_FMT_DT = '%a %b %d, %Y, %I:%M %p'
+_FMT_D = '%a %b %d, %Y'
+
+# Lookup tables for _parse_rmv_date.
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+_WEEKDAYS = frozenset(("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"))
+
+# Placeholder values the scraper returns instead of a date.
+_SENTINELS = frozenset(("No Appointments Available", "No Date Found", "Location Not Available"))
+
+NTFY_MESSAGE_SEPARATOR = "\n---\n"
+
+# One HTTP session for the whole process so ntfy requests reuse the same connection.
+SESSION = requests.Session()
+
+# Set by the signal handler to wake the monitor loop and stop it.
+_stop = threading.Event()
+# Set only while the loop is sleeping between checks. At any other time (setup, or in the
+# middle of a check) a shutdown signal exits immediately instead.
+_waiting = threading.Event()
+
+# A single Chrome session is shared by every check for the lifetime of the process.
+_DRIVER = None
+
+def get_driver():
+    """Returns the shared Chrome driver, starting it on first use."""
+    global _DRIVER
+    if _DRIVER is None:
+        _DRIVER = create_driver()
+    return _DRIVER
+
+def reset_driver():
+    """Clears session state between checks. Drops the driver if it is no longer usable."""
+    if _DRIVER is None:
+        return
+    try:
+        _DRIVER.delete_all_cookies()
+        _DRIVER.get("about:blank")
+    except Exception as e:
+        logger.warning(f"Chrome session is no longer usable, it will be restarted on the next check: {e}")
+        quit_driver()
+
+def quit_driver():
+    """Shuts down the shared Chrome driver if it is running."""
+    global _DRIVER
+    if _DRIVER is None:
+        return
+    try:
+        _DRIVER.quit()
+    except Exception as e:
+        logger.warning(f"Error shutting down Chrome: {e}")
+    _DRIVER = None
+
+atexit.register(quit_driver)
+
+# Contents of booking.md, re-read only when the file's modification time changes.
+_BOOKING_CACHE = {"mtime": -1, "content": ""}
 
 def appointment_text_links():
+    """Returns the booking links text, cached until booking.md is modified."""
     file_path = Path(APPOINTMENT_TEXT_FILE)
-    content = file_path.read_text(encoding="utf-8") if file_path.exists() else ""
-    return content
+    try:
+        mtime = file_path.stat().st_mtime
+        if mtime != _BOOKING_CACHE["mtime"]:
+            _BOOKING_CACHE["content"] = file_path.read_text(encoding="utf-8")
+            _BOOKING_CACHE["mtime"] = mtime
+    except FileNotFoundError:
+        return ""
+    return _BOOKING_CACHE["content"]
 
 def load_locations_map():
     """Loads the locations ID to friendly name mapping."""
-    if not os.path.exists(LOCATIONS_MAP_FILE):
-        return {}
-    with open(LOCATIONS_MAP_FILE, 'r') as f:
-        return json.load(f)
+    return load_json(LOCATIONS_MAP_FILE)
 
 def save_locations_map(locations_map):
     """Saves the locations ID to friendly name mapping."""
-    with open(LOCATIONS_MAP_FILE, 'w') as f:
-        json.dump(locations_map, f, indent=2)
+    save_json(locations_map, LOCATIONS_MAP_FILE)
 
 def get_friendly_name(location_id, locations_map):
     """Gets the friendly name for a location ID, with fallback."""
@@ -83,23 +149,30 @@ def get_friendly_name(location_id, locations_map):
         logger.warning(f"Location ID {location_id} not found in locations map, using fallback: {friendly_name}")
     return friendly_name
 
+# Friendly names of the monitored locations, keyed by ID. Filled once at startup by run_monitor.
+MONITORED_NAMES = {}
+
+def build_monitored_names(location_ids, locations_map):
+    """Resolves the friendly name of every monitored location once, warning about any missing from the map."""
+    return {str(location_id): get_friendly_name(location_id, locations_map) for location_id in location_ids}
+
 def refresh_locations_map_if_needed(locations_map, all_locations_data):
     """Refreshes the locations map if new locations are found."""
     if not locations_map:
         return False
     
-    current_ids = set(locations_map.keys())
-    new_ids = set(loc['id'] for loc in all_locations_data)
+    added = False
+    for loc in all_locations_data:
+        if loc['id'] not in locations_map:
+            if not added:
+                logger.info("New locations found, updating locations map...")
+                added = True
+            locations_map[loc['id']] = loc['service_center']
+            logger.info(f"Added new location: {loc['id']} -> {loc['service_center']}")
     
-    if new_ids - current_ids:
-        logger.info("New locations found, updating locations map...")
-        for loc in all_locations_data:
-            if loc['id'] not in locations_map:
-                locations_map[loc['id']] = loc['service_center']
-                logger.info(f"Added new location: {loc['id']} -> {loc['service_center']}")
+    if added:
         save_locations_map(locations_map)
-        return True
-    return False
+    return added
 
 def init_wandb():
     """Initialize wandb for tracking appointment patterns."""
@@ -115,79 +188,167 @@ def init_wandb():
         logger.warning(f"Could not initialize wandb: {e}")
         return False
 
-def log_appointment_event(wandb_run, event_type, location_data, previous_date=None, new_date=None, time_diff_hours=None, locations_map=None):
-    """Log appointment events to wandb for pattern analysis."""
+def log_appointment_event(cycle_events, wandb_run, ctx, event_type, location_data, previous_date=None, new_date=None, time_diff_hours=None):
+    """
+    Record an appointment event for wandb pattern analysis. Events are sent at the end of the check by flush_appointment_events.
+    ctx holds the time fields (weekday, hour_of_day, month, timestamp) computed once for the whole check.
+    """
     if not wandb_run:
         return
     
+    cycle_events.append({
+        "event_type": event_type,
+        "location_id": location_data['id'],
+        "location_name": MONITORED_NAMES[str(location_data['id'])],
+        "previous_appointment": previous_date,
+        "new_appointment": new_date,
+        "time_difference_hours": time_diff_hours,
+        **ctx,
+    })
+
+def flush_appointment_events(wandb_run, cycle_events, no_change_count, ctx):
+    """
+    Log the events recorded during one check to wandb. Each change event is logged on its own,
+    as before; unchanged locations are reported as a single no_change_count for the check.
+    """
+    if not wandb_run or not (cycle_events or no_change_count):
+        return
+    
     try:
-        # Parse dates for analysis
-        new_date_obj = parse_date(new_date) if new_date else None
-        previous_date_obj = parse_date(previous_date) if previous_date else None
-        
-        # Calculate additional metrics
-        current_time = datetime.now()
-        weekday = current_time.strftime("%A")
-        hour_of_day = current_time.hour
-        month = current_time.strftime("%B")
-        
-        # Get friendly name from our locations map
-        location_id = str(location_data['id'])
-        location_name = get_friendly_name(location_id, locations_map) if locations_map else f"ID-{location_id}"
-        
-        # Log to wandb
-        wandb.log({
-            "event_type": event_type,
-            "location_id": location_data['id'],
-            "location_name": location_name,
-            "previous_appointment": previous_date,
-            "new_appointment": new_date,
-            "time_difference_hours": time_diff_hours,
-            "weekday": weekday,
-            "hour_of_day": hour_of_day,
-            "month": month,
-            "timestamp": current_time.isoformat(),
-            "check_number": wandb.run.step if hasattr(wandb.run, 'step') else 0
-        })
-        
-        logger.info(f"Logged {event_type} event to wandb for {location_name}")
+        for event in cycle_events:
+            event["check_number"] = wandb.run.step if hasattr(wandb.run, 'step') else 0
+            wandb.log(event)
+            logger.info(f"Logged {event['event_type']} event to wandb for {event['location_name']}")
         
+        if no_change_count:
+            wandb.log({
+                "no_change_count": no_change_count,
+                "timestamp": ctx["timestamp"],
+                "check_number": wandb.run.step if hasattr(wandb.run, 'step') else 0
+            })
     except Exception as e:
         logger.error(f"Error logging to wandb: {e}")
 
 def load_json(file_path):
-    """Loads data from a JSON file."""
-    if not os.path.exists(file_path):
+    """Loads data from a JSON file, or an empty dict if it does not exist."""
+    try:
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
         return {}
-    with open(file_path, 'r') as f:
-        return json.load(f)
 
 def save_json(data, file_path):
-    """Saves data to a JSON file."""
-    with open(file_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    """Saves data to a JSON file, writing a temp file first so a crash never leaves it half-written."""
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    os.replace(tmp_path, file_path)
+
+# Snapshot of the state as last read from or written to STATE_FILE.
+_saved_state = None
+
+def _state_snapshot(state):
+    return tuple(sorted(state.items()))
+
+def load_state():
+    """Loads the state file and remembers what it contained."""
+    global _saved_state
+    state = load_json(STATE_FILE)
+    _saved_state = _state_snapshot(state)
+    return state
+
+def save_state(state):
+    """Saves the state file, unless it already holds exactly this state."""
+    global _saved_state
+    snapshot = _state_snapshot(state)
+    if snapshot == _saved_state:
+        return False
+    save_json(state, STATE_FILE)
+    _saved_state = snapshot
+    return True
 
 def send_ntfy_notification(url, message):
     """Sends a notification to a ntfy URL."""
     try:
-        requests.post(url, data=message.encode('utf-8'))
+        SESSION.post(url, data=message.encode('utf-8'))
         logger.info(f"Sent notification: {message}")
     except Exception as e:
         logger.error(f"Error sending ntfy notification: {e}")
 
+def send_ntfy_notifications(url, messages):
+    """Sends all notifications from one check as a single ntfy message, followed by the booking links."""
+    if not messages:
+        return
+    message = NTFY_MESSAGE_SEPARATOR.join(messages)
+    booking_text = appointment_text_links()
+    if booking_text:
+        message = message + "\n" + booking_text
+    send_ntfy_notification(url, message)
+
+def _is_number(text, max_digits):
+    """True if text is 1..max_digits ASCII digits, which is what strptime's numeric fields accept."""
+    return 0 < len(text) <= max_digits and text.isascii() and text.isdigit()
+
+def _parse_rmv_date(date_str):
+    """
+    Fast positional parser for the two fixed RMV formats, e.g. 'Tue Nov 12, 2024, 10:30 AM'
+    and 'Tue Nov 12, 2024'. Returns (datetime, has_time).
+    It never accepts a string that _FMT_DT/_FMT_D would reject; anything it does not recognise
+    raises ValueError so parse_date can fall back to strptime.
+    """
+    parts = date_str.split()
+    if len(parts) not in (4, 6) or parts[0] not in _WEEKDAYS:
+        raise ValueError(f"not an RMV date: {date_str!r}")
+    month = _MONTHS.get(parts[1])
+    day_str = parts[2][:-1]
+    year_str = parts[3] if len(parts) == 4 else parts[3][:-1]
+    if (
+        month is None
+        or not parts[2].endswith(',') or not _is_number(day_str, 2)
+        or len(year_str) != 4 or not _is_number(year_str, 4)
+        or (len(parts) == 6 and not parts[3].endswith(','))
+    ):
+        raise ValueError(f"invalid date in {date_str!r}")
+    day = int(day_str)
+    year = int(year_str)
+    if len(parts) == 4:
+        return datetime(year, month, day), False
+
+    hour_str, _, minute_str = parts[4].partition(':')
+    meridiem = parts[5]
+    if not _is_number(hour_str, 2) or not _is_number(minute_str, 2) or meridiem not in ("AM", "PM"):
+        raise ValueError(f"invalid time in {date_str!r}")
+    hour = int(hour_str)
+    minute = int(minute_str)
+    if not 1 <= hour <= 12 or minute > 59:
+        raise ValueError(f"invalid time in {date_str!r}")
+    if meridiem == "PM" and hour < 12:
+        hour += 12
+    elif meridiem == "AM" and hour == 12:
+        hour = 0
+    return datetime(year, month, day, hour, minute), True
+
 def parse_date(date_str):
-    """Parses the scraped date string into a datetime object."""
-    if "No Appointments" in date_str or "No Date Found" in date_str or "Location Not Available" in date_str:
-        return None
+    """
+    Parses the scraped date string into a (datetime, has_time) tuple, where has_time tells
+    whether the string included a time slot. Returns (None, False) if there is no valid date.
+    """
+    if date_str in _SENTINELS:
+        return None, False
+    lines = date_str.strip().splitlines()
+    clean_date_str = lines[0].strip().rstrip(',') if lines else ""
     try:
-        clean_date_str = date_str.strip().splitlines()[0].strip().rstrip(',')
-        return datetime.strptime(clean_date_str, '%a %b %d, %Y, %I:%M %p')
+        return _parse_rmv_date(clean_date_str)
+    except ValueError:
+        pass
+    try:
+        return datetime.strptime(clean_date_str, _FMT_DT), True
     except ValueError:
         try:
-            return datetime.strptime(clean_date_str, '%a %b %d, %Y')
+            return datetime.strptime(clean_date_str, _FMT_D), False
         except ValueError as e:
             logger.error(f"Error parsing date string '{date_str}': {e}")
-            return None
+            return None, False
 
 def _parse_target_month(value):
     """
@@ -257,7 +418,7 @@ def _should_notify_for_date(dt, target_month, target_year):
         return True
     return dt.month == target_month and dt.year == target_year
 
-def check_for_appointments(rmv_url, ntfy_url, locations_to_monitor, state, wandb_run=None, locations_map=None):
+def check_for_appointments(rmv_url, ntfy_url, locations_to_monitor, state, wandb_run=None):
     """The core logic for checking appointments and sending notifications."""
     logger.info(f"--- Running RMV Appointment Check ---")
 
@@ -269,12 +430,22 @@ def check_for_appointments(rmv_url, ntfy_url, locations_to_monitor, state, wandb
         # If dotenv isn't available for some reason, we still run with existing env vars.
         pass
     
-    live_data = get_rmv_data(rmv_url, locations_to_monitor)
+    try:
+        live_data = get_rmv_data(get_driver(), rmv_url, locations_to_monitor)
+    finally:
+        reset_driver()
     if not live_data:
         logger.warning("Could not fetch live appointment data.")
         return state
 
     current_time = datetime.now()
+    # Time fields shared by every wandb event of this check.
+    event_ctx = {
+        "weekday": current_time.strftime("%A"),
+        "hour_of_day": current_time.hour,
+        "month": current_time.strftime("%B"),
+        "timestamp": current_time.isoformat(),
+    }
     # Note: We could add a buffer time here to avoid updating state immediately 
     # when appointments pass, but for now we update immediately to ensure
     # the state stays current with the latest available appointments
@@ -285,12 +456,18 @@ def check_for_appointments(rmv_url, ntfy_url, locations_to_monitor, state, wandb
     else:
         logger.info("Notification filter disabled: notifying for any month.")
     
+    # Notifications are collected during the loop and sent as one message once it finishes.
+    pending_messages = []
+    # Set whenever state is modified, so an unchanged state is not rewritten.
+    dirty = False
+    # wandb change events are collected during the check and logged at the end.
+    cycle_events = []
+    no_change_count = 0
     for location_data in live_data:
         location_id = str(location_data['id'])
-        # Get friendly name from our locations map, fallback to ID if missing
-        location_name = get_friendly_name(location_id, locations_map) if locations_map else f"ID-{location_id}"
+        location_name = MONITORED_NAMES[location_id]
         new_date_str = location_data['earliest_date']
-        new_date = parse_date(new_date_str)
+        new_date, has_time = parse_date(new_date_str)
 
         if not new_date:
             if "Location Not Available" in new_date_str:
@@ -301,132 +478,67 @@ def check_for_appointments(rmv_url, ntfy_url, locations_to_monitor, state, wandb
                 logger.info(f"No appointments found for {location_name} (ID: {location_id}).")
             continue
 
+        # Parse everything once up front; the decision below reuses these values.
         last_known_date_str = state.get(location_id)
-        last_known_date = parse_date(last_known_date_str) if last_known_date_str else None
+        last_known_date = parse_date(last_known_date_str)[0] if last_known_date_str else None
 
-        # Check if the last known appointment has passed
-        # This ensures the state.json stays current with the latest available appointments
+        # Decide what kind of change this is; the state update, notification and wandb event
+        # that follow are the same for every kind.
         if last_known_date and last_known_date < current_time:
+            # The last known appointment has passed
+            # This ensures the state.json stays current with the latest available appointments
             logger.info(f"Last known appointment at {location_name} has passed (was: {last_known_date_str}). Updating state with new data: {new_date_str}")
-            
-            # Calculate time difference for analytics
-            time_diff_hours = None
-            if new_date and last_known_date:
-                time_diff = new_date - last_known_date
-                time_diff_hours = time_diff.total_seconds() / 3600
-            
-            # Update state with the new appointment data
-            if "AM" in new_date_str or "PM" in new_date_str:
-                # We have a specific time
-                state[location_id] = new_date_str
-                message = f"New appointment at {location_name}: {new_date.strftime('%a, %b %d, %Y at %I:%M %p')}"
-            else:
-                # We only have a date
-                state[location_id] = new_date_str
-                message = f"New earliest date at {location_name}: {new_date.strftime('%a, %b %d, %Y')}"
-            
-            # Log to wandb
-            log_appointment_event(wandb_run, "expired_replaced", location_data, last_known_date_str, new_date_str, time_diff_hours, locations_map)
-            message = message + "\n" + appointment_text_links()
-            # Send notification for the new appointment that replaced the expired one (if in target month/year)
-            if _should_notify_for_date(new_date, target_month, target_year):
-                send_ntfy_notification(ntfy_url, message)
-            else:
-                logger.info(
-                    f"Suppressed notification for {location_name}: {new_date.strftime('%a, %b %d, %Y')} "
-                    f"(outside target {target_month:02d}/{target_year})."
-                )
-            continue
-
-        # Check if location was previously unavailable but now has appointments
-        # We can detect this by checking if we have a valid date now but the last known date
-        # was from a previous check cycle (indicating the location was temporarily unavailable)
-        if last_known_date and new_date and new_date > last_known_date:
+            event_type = "expired_replaced"
+            new_state_value = new_date_str
+            time_diff_hours = (new_date - last_known_date).total_seconds() / 3600
+        elif last_known_date and new_date > last_known_date:
+            # Check if location was previously unavailable but now has appointments
+            # We can detect this by checking if we have a valid date now but the last known date
+            # was from a previous check cycle (indicating the location was temporarily unavailable)
             # This suggests the location might have been temporarily unavailable
             # and now has a later appointment than before
             logger.info(f"Location {location_name} (ID: {location_id}) appears to have new availability: {new_date_str}")
-            
-            # Calculate time difference for analytics
-            time_diff_hours = None
-            if new_date and last_known_date:
-                time_diff = new_date - last_known_date
-                time_diff_hours = time_diff.total_seconds() / 3600
-            
-            # Update state with the new appointment data
-            if "AM" in new_date_str or "PM" in new_date_str:
-                # We have a specific time
-                message = f"New appointment at {location_name}: {new_date.strftime('%a, %b %d, %Y at %I:%M %p')}"
-                state[location_id] = new_date_str
-            else:
-                # We only have a date
-                message = f"New earliest date at {location_name}: {new_date.strftime('%a, %b %d, %Y')}"
-                state[location_id] = new_date_str
-            
-            # Ensure we're using the friendly name in the notification
-            logger.info(f"Preparing notification for {location_name} (ID: {location_id}): {message}")
-            
-            # Log to wandb
-            log_appointment_event(wandb_run, "new_availability", location_data, last_known_date_str, new_date_str, time_diff_hours, locations_map)
-            
             # Additional logging to help debug location availability changes
             logger.info(f"Location {location_name} (ID: {location_id}) became available again. Previous: {last_known_date_str}, New: {new_date_str}")
-            message = message + "\n" + appointment_text_links()
-            
-            if _should_notify_for_date(new_date, target_month, target_year):
-                send_ntfy_notification(ntfy_url, message)
-            else:
-                logger.info(
-                    f"Suppressed notification for {location_name}: {new_date.strftime('%a, %b %d, %Y')} "
-                    f"(outside target {target_month:02d}/{target_year})."
-                )
-            continue
-
-        if not last_known_date or new_date < last_known_date:
-            # Check if the original scraped string contained a time component (AM/PM)
-            if "AM" in new_date_str or "PM" in new_date_str:
-                # We have a specific time
-                message = f"New appointment at {location_name}: {new_date.strftime('%a, %b %d, %Y at %I:%M %p')}"
-                state[location_id] = new_date.strftime('%a %b %d, %Y, %I:%M %p')
-            else:
-                # We only have a date
-                message = f"New earliest date at {location_name}: {new_date.strftime('%a, %b %d, %Y')}"
-                state[location_id] = new_date.strftime('%a %b %d, %Y')
-            
-            message = message + "\n" + appointment_text_links()
-            
-            if _should_notify_for_date(new_date, target_month, target_year):
-                send_ntfy_notification(ntfy_url, message)
-            else:
-                logger.info(
-                    f"Suppressed notification for {location_name}: {new_date.strftime('%a, %b %d, %Y')} "
-                    f"(outside target {target_month:02d}/{target_year})."
-                )
-            
-            # Log to wandb
-            time_diff_hours = None
-            if new_date and last_known_date:
-                time_diff = last_known_date - new_date  # Note: new_date is earlier, so we subtract
-                time_diff_hours = time_diff.total_seconds() / 3600
-            
+            event_type = "new_availability"
+            new_state_value = new_date_str
+            time_diff_hours = (new_date - last_known_date).total_seconds() / 3600
+        elif not last_known_date or new_date < last_known_date:
             event_type = "first_appointment" if not last_known_date else "earlier_appointment"
-            log_appointment_event(wandb_run, event_type, location_data, last_known_date_str, new_date_str, time_diff_hours, locations_map)
+            new_state_value = new_date.strftime(_FMT_DT if has_time else _FMT_D)
+            time_diff_hours = None
+            if last_known_date:
+                # Note: new_date is earlier, so we subtract it from the last known date
+                time_diff_hours = (last_known_date - new_date).total_seconds() / 3600
         else:
             logger.info(f"No change for {location_name}. Earliest is still {last_known_date_str}")
-            
-            # Log to wandb for no-change events (useful for pattern analysis)
-            if wandb_run:
-                # Get friendly name from our locations map
-                location_id = str(location_data['id'])
-                location_name_for_logging = get_friendly_name(location_id, locations_map) if locations_map else f"ID-{location_id}"
-                
-                wandb.log({
-                    "event_type": "no_change",
-                    "location_id": location_data['id'],
-                    "location_name": location_name_for_logging,
-                    "current_appointment": last_known_date_str,
-                    "timestamp": datetime.now().isoformat(),
-                    "check_number": wandb.run.step if hasattr(wandb.run, 'step') else 0
-                })
+            # Unchanged locations are only counted; the total is logged to wandb as no_change_count.
+            no_change_count += 1
+            continue
+
+        state[location_id] = new_state_value
+        dirty = True
+
+        if has_time:
+            # We have a specific time
+            message = f"New appointment at {location_name}: {new_date.strftime('%a, %b %d, %Y at %I:%M %p')}"
+        else:
+            # We only have a date
+            message = f"New earliest date at {location_name}: {new_date.strftime('%a, %b %d, %Y')}"
+        logger.info(f"Preparing notification for {location_name} (ID: {location_id}): {message}")
+
+        log_appointment_event(cycle_events, wandb_run, event_ctx, event_type, location_data, last_known_date_str, new_date_str, time_diff_hours)
+
+        # Only notify for appointments in the target month/year (if a filter is set)
+        if _should_notify_for_date(new_date, target_month, target_year):
+            pending_messages.append(message)
+        else:
+            logger.info(
+                f"Suppressed notification for {location_name}: {new_date.strftime('%a, %b %d, %Y')} "
+                f"(outside target {target_month:02d}/{target_year})."
+            )
+    
+    send_ntfy_notifications(ntfy_url, pending_messages)
     
     # Ensure state is populated with earliest available appointments if it was empty
     # This handles the case where state.json was empty or all appointments expired
@@ -436,25 +548,33 @@ def check_for_appointments(rmv_url, ntfy_url, locations_to_monitor, state, wandb
             location_id = str(location_data['id'])
             location_name = location_data['service_center']
             new_date_str = location_data['earliest_date']
-            new_date = parse_date(new_date_str)
+            new_date, _ = parse_date(new_date_str)
             
             if new_date:
                 state[location_id] = new_date_str
+                dirty = True
                 logger.info(f"Added {location_name} to state: {new_date_str}")
                 
                 # Log to wandb for initial state population
-                log_appointment_event(wandb_run, "initial_population", location_data, None, new_date_str, None, locations_map)
+                log_appointment_event(cycle_events, wandb_run, event_ctx, "initial_population", location_data, None, new_date_str, None)
     
-    save_json(state, STATE_FILE)
+    flush_appointment_events(wandb_run, cycle_events, no_change_count, event_ctx)
+    
+    if dirty:
+        save_state(state)
     logger.info("--- Check complete ---")
     return state
 
 def signal_handler(signum, frame):
-    """Handle graceful shutdown."""
+    """
+    Handle graceful shutdown. While sleeping between checks, wake and stop the loop;
+    otherwise (setup prompts, a running check) exit right away. Either way the loop's
+    finally block and the atexit hook still clean up wandb and Chrome.
+    """
     logger.info("Received shutdown signal. Cleaning up...")
-    if wandb.run:
-        wandb.finish()
-    sys.exit(0)
+    _stop.set()
+    if not _waiting.is_set():
+        sys.exit(0)
 
 def run_monitor():
     """Main monitoring loop."""
@@ -493,7 +613,7 @@ def run_monitor():
             sys.exit(1)
         logger.warning("LOCATIONS_TO_MONITOR not found in .env file.")
         # This prompt now returns the fetched location data, so we don't have to fetch it again.
-        locations_to_monitor_ids_str, all_locations_data = prompt_for_locations(rmv_url)
+        locations_to_monitor_ids_str, all_locations_data = prompt_for_locations(rmv_url, get_driver())
         load_dotenv(override=True)
 
     frequency_minutes_str = os.getenv("CHECK_FREQUENCY_MINUTES")
@@ -514,21 +634,17 @@ def run_monitor():
     
     locations_to_monitor_ids = locations_to_monitor_ids_str.split(',')
     frequency_minutes = int(frequency_minutes_str)
+    if frequency_minutes < 1:
+        logger.error(f"FATAL: CHECK_FREQUENCY_MINUTES must be at least 1 (got {frequency_minutes}). Please fix it in your .env file.")
+        sys.exit(1)
 
     # If we haven't already fetched the location data during setup, fetch it now.
     if all_locations_data is None:
         logger.info("Fetching all location data for friendly names...")
-        options = webdriver.ChromeOptions()
-        options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        driver = None
         try:
-            driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=options)
-            all_locations_data = get_all_locations(driver, rmv_url)
+            all_locations_data = get_all_locations(get_driver(), rmv_url)
         finally:
-            if driver:
-                driver.quit()
+            reset_driver()
     
     if not all_locations_data:
         logger.error("Could not fetch location data. Exiting.")
@@ -546,16 +662,18 @@ def run_monitor():
         # Check if we need to refresh the map with any new locations
         refresh_locations_map_if_needed(locations_map, all_locations_data)
     
-    # Create locations_to_monitor using the mapping
-    locations_to_monitor = [
-        {'id': loc_id, 'service_center': get_friendly_name(loc_id, locations_map)} 
-        for loc_id in locations_to_monitor_ids
-    ]
+    # Resolve the monitored IDs to friendly names once; the checks only do dict lookups.
+    MONITORED_NAMES.clear()
+    MONITORED_NAMES.update(build_monitored_names(locations_to_monitor_ids, locations_map))
+    
+    # Create locations_to_monitor using the mapping; it is built once and shared by every check.
+    locations_to_monitor = tuple(
+        MonitoredLocation(loc_id, friendly_name) for loc_id, friendly_name in MONITORED_NAMES.items()
+    )
     
     # Log the mapping for debugging
     logger.info("Locations mapping:")
-    for loc_id in locations_to_monitor_ids:
-        friendly_name = get_friendly_name(loc_id, locations_map)
+    for loc_id, friendly_name in MONITORED_NAMES.items():
         logger.info(f"  {loc_id} -> {friendly_name}")
 
     # --- State Reset ---
@@ -565,7 +683,7 @@ def run_monitor():
             os.remove(STATE_FILE)
             logger.info("Deleted state.json")
     
-    state = load_json(STATE_FILE)
+    state = load_state()
 
     # Initialize wandb for tracking
     wandb_run = init_wandb()
@@ -581,22 +699,37 @@ def run_monitor():
 
     logger.info(f"Starting monitor. Will check every {frequency_minutes} minutes.")
 
+    # Checks run at a fixed rate: each one is scheduled frequency_minutes after the previous
+    # one *started*, so the time a check takes does not push the schedule back.
+    interval_seconds = frequency_minutes * 60
+    next_run = time.monotonic()
     try:
-        while True:
+        while not _stop.is_set():
+            next_run += interval_seconds
             try:
-                state = check_for_appointments(rmv_url, ntfy_url, locations_to_monitor, state, wandb_run, locations_map)
+                state = check_for_appointments(rmv_url, ntfy_url, locations_to_monitor, state, wandb_run)
             except Exception as e:
                 logger.error("An unexpected error occurred during the check:", exc_info=True)
                 logger.warning("The monitor will continue running.")
             
-            logger.info(f"Sleeping for {frequency_minutes} minutes...")
+            # If a check overran its slot, drop the missed runs and continue with the next future one.
+            now = time.monotonic()
+            if now >= next_run:
+                missed = int((now - next_run) // interval_seconds) + 1
+                logger.warning(f"Check took longer than {frequency_minutes} minutes; skipping {missed} missed check(s).")
+                next_run += missed * interval_seconds
+            
+            delay = next_run - now
+            next_check = datetime.now() + timedelta(seconds=delay)
+            logger.info(f"Next check at {next_check.strftime('%I:%M:%S %p')}.")
             
-            # Show progress bar for sleep countdown
-            total_seconds = frequency_minutes * 60
-            with tqdm(total=total_seconds, desc="Next check in", unit="s", bar_format="{desc}: {bar} {n_fmt}/{total_fmt}s [{elapsed}<{remaining}]") as pbar:
-                for _ in range(total_seconds):
-                    time.sleep(1)
-                    pbar.update(1)
+            # Sleep until then in one wait; a shutdown signal wakes it immediately.
+            _waiting.set()
+            try:
+                if _stop.wait(timeout=delay):
+                    break
+            finally:
+                _waiting.clear()
     finally:
         # Ensure wandb is properly closed
         if wandb_run and wandb.run:
@@ -2,6 +2,8 @@ import argparse
 import sys
 import logging
 import os
+import subprocess
+from collections import namedtuple
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -13,6 +15,15 @@ from webdriver_manager.chrome import ChromeDriverManager
 # Use the same logger as the main monitor
 logger = logging.getLogger(__name__)
 
+DRIVER_CACHE_DIR = '.driver_cache'
+DRIVER_PATH_FILE = os.path.join(DRIVER_CACHE_DIR, 'path')
+
+# A location to check: its RMV data-id and the friendly name resolved for it at startup.
+MonitoredLocation = namedtuple('MonitoredLocation', ['id', 'service_center'])
+
+UNKNOWN_CHROME_VERSION = 'unknown'
+CHROME_BINARIES = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser")
+
 def update_env_file(key, value):
     """
     Adds or updates a key-value pair in the .env file, preserving other values.
@@ -36,6 +47,55 @@ def update_env_file(key, value):
         if not key_found:
             f.write(f"{key}={value}\n")
 
+def get_chrome_version():
+    """Returns the installed Chrome's version string (e.g. 'Google Chrome 124.0.6367.91'), or None if not found."""
+    for binary in CHROME_BINARIES:
+        try:
+            result = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=10)
+        except (OSError, subprocess.SubprocessError):
+            continue
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip()
+    return None
+
+def get_chromedriver_path():
+    """
+    Returns the chromedriver binary path, reusing the one cached on disk across runs.
+    The cache file holds the Chrome version on its first line and the driver path on its second.
+    ChromeDriverManager (which checks for updates over the network) is only consulted when the
+    cached binary is missing or Chrome's version has changed since it was installed.
+    If Chrome's version cannot be determined, the cached driver is reused as long as it exists.
+    """
+    chrome_version = get_chrome_version()
+    if chrome_version is None:
+        logger.warning("Could not determine the installed Chrome version; cached chromedriver will not be checked against it.")
+        chrome_version = UNKNOWN_CHROME_VERSION
+    try:
+        with open(DRIVER_PATH_FILE, 'r') as f:
+            lines = f.read().splitlines()
+        if len(lines) >= 2:
+            cached_version, cached_path = lines[0], lines[1]
+            if cached_version == chrome_version and cached_path and os.path.isfile(cached_path):
+                return cached_path
+    except FileNotFoundError:
+        pass
+
+    logger.info(f"Installing chromedriver for Chrome version: {chrome_version}...")
+    driver_path = ChromeDriverManager().install()
+    os.makedirs(DRIVER_CACHE_DIR, exist_ok=True)
+    with open(DRIVER_PATH_FILE, 'w') as f:
+        f.write(f"{chrome_version}\n{driver_path}\n")
+    return driver_path
+
+def create_driver():
+    """Starts a headless Chrome browser. Callers are responsible for calling quit() on it."""
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36")
+    return webdriver.Chrome(service=ChromeService(get_chromedriver_path()), options=options)
+
 def get_all_locations(driver, url):
     """Gets all available RMV locations from the initial page."""
     wait = WebDriverWait(driver, 10)
@@ -69,21 +129,21 @@ def prompt_for_ntfy_url():
     update_env_file("NTFY_URL", url)
     return url
 
-def prompt_for_locations(rmv_url):
-    """Prompts user to select locations and saves their internal IDs."""
+def prompt_for_locations(rmv_url, driver=None):
+    """
+    Prompts user to select locations and saves their internal IDs.
+    If a driver is given it is reused (and left open); otherwise a temporary one is started.
+    """
     print("Fetching available RMV locations...")
-    options = webdriver.ChromeOptions()
-    options.add_argument("--headless")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    
-    driver = None
-    try:
-        driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=options)
+    if driver:
         all_locations = get_all_locations(driver, rmv_url)
-    finally:
-        if driver:
-            driver.quit()
+    else:
+        try:
+            driver = create_driver()
+            all_locations = get_all_locations(driver, rmv_url)
+        finally:
+            if driver:
+                driver.quit()
 
     if not all_locations:
         logger.error("Could not fetch locations. Cannot proceed.")
@@ -119,7 +179,9 @@ def prompt_for_frequency():
     while True:
         try:
             frequency_minutes = int(input("How often to check for appointments (in minutes)? [default: 5]: ") or "5")
-            break
+            if frequency_minutes >= 1:
+                break
+            print("Error: The check frequency must be at least 1 minute.", file=sys.stderr)
         except ValueError:
             print("Error: Please enter a valid number.", file=sys.stderr)
     update_env_file("CHECK_FREQUENCY_MINUTES", str(frequency_minutes))
@@ -222,63 +284,51 @@ def get_earliest_date(driver, wait):
         return "Error during scraping"
 
 
-def get_rmv_data(url, locations_to_check_by_id=None):
+def get_rmv_data(driver, url, locations_to_check_by_id=None):
     """
-    Initializes a headless Chrome browser and scrapes appointment data for the specified locations.
+    Scrapes appointment data for the specified MonitoredLocation entries using an already running browser.
+    The driver is left open so it can be reused for the next check.
     """
-    options = webdriver.ChromeOptions()
-    options.add_argument("--headless")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36")
-    
-    driver = None  # Initialize driver to None
-    try:
-        driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=options)
-        wait = WebDriverWait(driver, 10)
-        results = []
-        num_to_check = len(locations_to_check_by_id)
+    wait = WebDriverWait(driver, 10)
+    results = []
+    num_to_check = len(locations_to_check_by_id)
 
-        for i, location in enumerate(locations_to_check_by_id):
+    for i, location in enumerate(locations_to_check_by_id):
+        try:
+            driver.get(url)
+            
+            # Try to find the element for this location
             try:
-                driver.get(url)
-                
-                # Try to find the element for this location
-                try:
-                    element_to_click = wait.until(EC.presence_of_element_located((By.XPATH, f"//button[@data-id='{location['id']}']")))
-                except TimeoutException:
-                    location_name = location.get('service_center', f"ID-{location['id']}")
-                    logger.warning(f"Location {location_name} (ID: {location['id']}) not found on the page, skipping to next location")
-                    # Add a result indicating this location was not available
-                    results.append({
-                        "id": location['id'],
-                        "service_center": location_name,
-                        "earliest_date": "Location Not Available"
-                    })
-                    continue
-                
-                location_name = location['service_center']
-                logger.info(f"Checking {i+1}/{num_to_check}: {location_name}...")
-                driver.execute_script("arguments[0].click();", element_to_click)
-
-                earliest_date = get_earliest_date(driver, wait)
-                
+                element_to_click = wait.until(EC.presence_of_element_located((By.XPATH, f"//button[@data-id='{location.id}']")))
+            except TimeoutException:
+                location_name = location.service_center
+                logger.warning(f"Location {location_name} (ID: {location.id}) not found on the page, skipping to next location")
+                # Add a result indicating this location was not available
                 results.append({
-                    "id": location['id'],
+                    "id": location.id,
                     "service_center": location_name,
-                    "earliest_date": earliest_date
+                    "earliest_date": "Location Not Available"
                 })
-            except Exception as e:
-                location_name = location.get('service_center', f"ID-{location['id']}")
-                logger.error(f"An unexpected error occurred while checking {location_name}", exc_info=True)
-                # Continue to the next location
                 continue
-        
-        return results
-    finally:
-        # This will always run, ensuring the browser is closed even if errors occur.
-        if driver:
-            driver.quit()
+            
+            location_name = location.service_center
+            logger.info(f"Checking {i+1}/{num_to_check}: {location_name}...")
+            driver.execute_script("arguments[0].click();", element_to_click)
+
+            earliest_date = get_earliest_date(driver, wait)
+            
+            results.append({
+                "id": location.id,
+                "service_center": location_name,
+                "earliest_date": earliest_date
+            })
+        except Exception as e:
+            location_name = location.service_center
+            logger.error(f"An unexpected error occurred while checking {location_name}", exc_info=True)
+            # Continue to the next location
+            continue
+    
+    return results
 
 
 if __name__ == "__main__":